@@ -1,7 +1,7 @@
 import sys
 import threading
 
-from PySide6.QtCore import QObject, QTimer, Signal, Slot
+from PySide6.QtCore import QMetaObject, QObject, Qt, QThread, Signal, Slot
 from PySide6.QtWidgets import QMessageBox
 
 from mozregression.approx_persist import ApproxPersistChooser
@@ -23,6 +23,16 @@ Bisection.EXCEPTION = -1  # new possible value of bisection end
 
 
 class GuiBisector(QObject, Bisector):
+    """
+    Bisector that runs its blocking tasks in a worker thread.
+
+    The instance is moved to that thread by the build runner, and all its
+    slots (_bisect_next, _evaluate, _build_dl_finished, _evaluate_finished,
+    ...) must execute there. Signals coming from the download threads and
+    from the main thread are connected with queued connections, so they are
+    always delivered in the worker thread.
+    """
+
     started = Signal()
     finished = Signal(object, int)
     choose_next_build = Signal()
@@ -47,11 +57,22 @@ class GuiBisector(QObject, Bisector):
         self._next_build_index = None
         self.download_in_background = download_in_background
         self.index_promise = None
+        self._next_builds = ()
         self._persist_files = ()
         self.should_stop = threading.Event()
 
-        self.download_manager.download_finished.connect(self._build_dl_finished)
-        self.test_runner.evaluate_finished.connect(self._evaluate_finished)
+        # download_finished is emitted from download threads (or from this
+        # one, in focus_download) and evaluate_finished from the main thread.
+        # In both cases, the slot must run later in the working thread.
+        self.download_manager.download_finished.connect(
+            self._build_dl_finished, type=Qt.QueuedConnection
+        )
+        self.test_runner.evaluate_finished.connect(
+            self._evaluate_finished, type=Qt.QueuedConnection
+        )
+
+    def _assert_in_thread(self):
+        assert QThread.currentThread() == self.thread(), "not in the bisector thread"
 
     def _finish_on_exception(self, bisection):
         self.error = sys.exc_info()
@@ -114,7 +135,11 @@ class GuiBisector(QObject, Bisector):
     @Slot()
     def _bisect_next(self):
         # this is executed in the working thread
-        if self.test_runner.verdict != "r":
+        self._assert_in_thread()
+        # no need to search the mid point again when it is retried or
+        # when the user already chose the build to test next: the build
+        # range has not changed since the last search.
+        if self.test_runner.verdict != "r" and self._next_build_index is None:
             try:
                 self.mid = self.bisection.search_mid_point(interrupt=self.should_stop.is_set)
             except MozRegressionError:
@@ -157,63 +182,87 @@ class GuiBisector(QObject, Bisector):
             ) = self.bisection._find_approx_build(self.mid, self.build_infos)
             if not found:
                 self.download_manager.focus_download(self.build_infos)
+            self._find_next_builds()
             self.step_build_found.emit(self.bisection, self.build_infos)
             if found:
                 # to continue the bisection, act as if it was downloaded
                 self._build_dl_finished(None, self.build_infos.build_file)
 
-    @Slot()
-    def _evaluate(self):
-        # this is called in the working thread, so installation does not
-        # block the ui.
-
-        # download in background, if desired and that last verdict was not
-        # a skip.
+    def _find_next_builds(self):
+        # find the next builds to download in background, if desired and
+        # that last verdict was not a skip. Only their build infos are
+        # fetched while the current build downloads, so it gets the whole
+        # bandwidth; they are downloaded once it is launched, see _evaluate.
+        self.index_promise = None
+        self._next_builds = ()
         if self.download_in_background and self.test_runner.verdict != "s":
             self.index_promise = IndexPromise(
                 self.mid,
-                self.bisection._download_next_builds,
+                self._search_next_builds,
                 args=(self._persist_files,),
             )
+
+    def _search_next_builds(self, mid, persist_files):
+        # this is executed in the index promise thread
+        try:
+            mid, self._next_builds = self.bisection._find_next_builds(
+                mid, persist_files, interrupt=self.should_stop.is_set
+            )
+        except StopIteration:
+            pass
+        return mid
+
+    def _wait_next_builds(self):
+        # wait for the search of the next builds, and returns them
+        if self.index_promise:
+            self.mid = self.index_promise()
+            self.index_promise = None
+        next_builds, self._next_builds = self._next_builds, ()
+        return next_builds
+
+    @Slot()
+    def _evaluate(self):
+        # this is called in the working thread, so installation does not
+        # block the ui.
+        self._assert_in_thread()
+
         # run the build evaluation
         self.bisection.evaluate(self.build_infos)
-        # wait for the next index in the thread if any
-        if self.index_promise:
-            self.index_promise()
+        # wait for the next builds, searched while the build was downloading
+        # or installing
+        next_builds = self._wait_next_builds()
+        if self.test_runner.run_error:
             # if there was an error, stop the possible downloads
-            if self.test_runner.run_error:
-                self.download_manager.cancel()
-                self.download_manager.wait(raise_if_error=False)
-        if not self.test_runner.run_error:
+            self.download_manager.cancel()
+            self.download_manager.wait(raise_if_error=False)
+        else:
+            # the build is available, now download the next ones in
+            # background while the user evaluates this one
+            if not self.should_stop.is_set():
+                for build_info in next_builds:
+                    self.download_manager.download_in_background(build_info)
             self.step_testing.emit(self.bisection, self.build_infos)
 
     @Slot(object, str)
     def _build_dl_finished(self, dl, dest):
-        # here we are not in the working thread, since the connection was
-        # done in the constructor
+        # this is executed in the working thread
         if not dest == self.build_infos.build_file:
             return
         if dl is not None and (dl.is_canceled() or dl.error()):
             # todo handle this
+            self._wait_next_builds()
             return
-        # call this in the thread
-        QTimer.singleShot(0, self._evaluate)
+        self._evaluate()
 
     @Slot()
     def _evaluate_finished(self):
-        # here we are not in the working thread, since the connection was
-        # done in the constructor
-        if self.index_promise:
-            self.mid = self.index_promise()
-            self.index_promise = None
-
+        # this is executed in the working thread
         self.step_finished.emit(self.bisection, self.test_runner.verdict)
         result = self.bisection.handle_verdict(self.mid, self.test_runner.verdict)
         if result != Bisection.RUNNING:
             self.finished.emit(self.bisection, result)
         else:
-            # call this in the thread
-            QTimer.singleShot(0, self._bisect_next)
+            self._bisect_next()
 
 
 class BisectRunner(AbstractBuildRunner):
@@ -281,7 +330,7 @@ class BisectRunner(AbstractBuildRunner):
             self.stop()
             return
         self.worker._next_build_index = index
-        QTimer.singleShot(0, self.worker._bisect_next)
+        QMetaObject.invokeMethod(self.worker, "_bisect_next", Qt.QueuedConnection)
 
     @Slot(object, int)
     def bisection_finished(self, bisection, resultcode):
@@ -300,10 +349,10 @@ class BisectRunner(AbstractBuildRunner):
                 if isinstance(bisection.handler, NightlyHandler):
                     handler = bisection.handler
                     fetch_config.set_repo(fetch_config.get_nightly_repo(handler.bad_date))
-                    QTimer.singleShot(0, self.worker.bisect_further)
+                    QMetaObject.invokeMethod(self.worker, "bisect_further", Qt.QueuedConnection)
                 else:
                     # check merge, try to bisect further
-                    QTimer.singleShot(0, self.worker.check_merge)
+                    QMetaObject.invokeMethod(self.worker, "check_merge", Qt.QueuedConnection)
                 return
             msg = "The bisection is done."
         if dialog:
@@ -317,4 +366,4 @@ class BisectRunner(AbstractBuildRunner):
         self.worker.fetch_config.set_repo(str(branch))
         bisection.handler.good_revision = str(good_rev)
         bisection.handler.bad_revision = str(bad_rev)
-        QTimer.singleShot(0, self.worker.bisect_further)
+        QMetaObject.invokeMethod(self.worker, "bisect_further", Qt.QueuedConnection)
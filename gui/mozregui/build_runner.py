@@ -1,4 +1,6 @@
-from PySide6.QtCore import QObject, QThread, QTimer, Signal, Slot
+import time
+
+from PySide6.QtCore import QMetaObject, QObject, Qt, QThread, Signal, Slot
 
 from mozregression.download_manager import BuildDownloadManager
 from mozregression.errors import LauncherError, MozRegressionError
@@ -14,11 +16,28 @@ class GuiBuildDownloadManager(QObject, BuildDownloadManager):
     download_progress = Signal(object, int, int)
     download_started = Signal(object)
     download_finished = Signal(object, str)
+    # minimum delay (in seconds) between two download_progress emissions
+    progress_interval = 0.1
 
     def __init__(self, destdir, persist_limit, **kwargs):
         super().__init__(
             destdir=destdir, session=get_http_session(), persist_limit=persist_limit, **kwargs
         )
+        self._last_progress_ts = None
+
+    def _throttled_progress(self, dl, current, total):
+        # progress is reported for every downloaded chunk, and each signal
+        # emission is queued in the event loop of the main thread. Limit
+        # that rate, but always report the end of the download.
+        now = time.monotonic()
+        if (
+            current != total
+            and self._last_progress_ts is not None
+            and now - self._last_progress_ts < self.progress_interval
+        ):
+            return
+        self._last_progress_ts = now
+        self.download_progress.emit(dl, current, total)
 
     def _download_started(self, task):
         self.download_started.emit(task)
@@ -42,8 +61,14 @@ class GuiBuildDownloadManager(QObject, BuildDownloadManager):
         # build if any)
         self.cancel(cancel_if=lambda dl: dest != dl.get_dest())
 
-        dl = self.download(build_url, fname, progress=self.download_progress.emit)
-        if not dl:
+        self._last_progress_ts = None
+        with self._lock:
+            running_dl = self._downloads.get(dest)
+        if running_dl:
+            # the download was started in background before, without
+            # progress
+            running_dl.set_progress(self._throttled_progress)
+        elif not self.download(build_url, fname, progress=self._throttled_progress):
             # file already downloaded.
             # emit the finished signal so bisection goes on
             self.download_finished.emit(None, dest)
@@ -64,7 +89,10 @@ class GuiTestRunner(QObject):
         try:
             self.launcher = create_launcher(build_info)
             self.launcher.start(**self.launcher_kwargs)
-            build_info.update_from_app_info(self.launcher.get_app_info())
+            if build_info.changeset is None or build_info.repo_url is None:
+                # only old builds miss these, so only then do we need to
+                # read them from the installed application.
+                build_info.update_from_app_info(self.launcher.get_app_info())
         except Exception as exc:
             self.run_error = True
             self.evaluate_started.emit(str(exc))
@@ -111,8 +139,9 @@ class AbstractBuildRunner(QObject):
         """
         Create and initialize the worker.
 
-        Should be subclassed to configure the worker, and should return the
-        worker method that should start the work.
+        Should be subclassed to configure the worker, and must return the
+        slot of the worker (decorated with @Slot()) that should start the
+        work.
         """
         self.options = options
 
@@ -169,10 +198,13 @@ class AbstractBuildRunner(QObject):
 
     def start(self, fetch_config, options):
         action = self.init_worker(fetch_config, options)
-        assert callable(action), "%s should be callable" % action
+        assert getattr(action, "__self__", None) is self.worker, (
+            "%s should be a slot of the worker" % action
+        )
         self.thread.start()
         # this will be called in the worker thread.
-        QTimer.singleShot(0, action)
+        invoked = QMetaObject.invokeMethod(self.worker, action.__name__, Qt.QueuedConnection)
+        assert invoked, "%s should be a slot of the worker" % action
         # an action = instance of mozregression usage, so send
         # a usage ping (if telemetry is disabled, it will automatically
         # be discarded)
@@ -4,8 +4,8 @@ from configobj import ConfigObj
 from glean import Glean
 from PySide6.QtWidgets import QDialog
 
+from mozregression import network
 from mozregression.config import ARCHIVE_BASE_URL, DEFAULT_CONF_FNAME, get_config
-from mozregression.network import set_http_session
 from mozregui.ui.global_prefs import Ui_GlobalPrefs
 
 
@@ -66,8 +66,16 @@ def set_default_prefs():
         save_prefs(options)
 
 
+_HTTP_SESSION_TIMEOUT = None
+
+
 def apply_prefs(options):
-    set_http_session(get_defaults={"timeout": options["http_timeout"]})
+    global _HTTP_SESSION_TIMEOUT
+    # keep the same http session (and so its pool of connections) between
+    # runs, unless the timeout has changed.
+    if network.SESSION is None or options["http_timeout"] != _HTTP_SESSION_TIMEOUT:
+        network.set_http_session(get_defaults={"timeout": options["http_timeout"]})
+        _HTTP_SESSION_TIMEOUT = options["http_timeout"]
     # persist options have to be passed in the bisection, not handled here.
 
 
@@ -0,0 +1,152 @@
+import threading
+
+import pytest
+from mock import MagicMock, Mock
+from PySide6.QtCore import QObject, Signal
+
+from mozregression.bisector import Bisection
+from mozregui.bisection import GuiBisector
+
+
+@pytest.fixture
+def bisector():
+    bisector = GuiBisector(Mock(), Mock(), Mock(), download_in_background=False)
+    bisector.bisection = MagicMock()
+    bisector.bisection.init_handler.return_value = Bisection.RUNNING
+    bisector.bisection._find_approx_build.side_effect = lambda mid, build_infos: (
+        False,
+        mid,
+        build_infos,
+        (),
+    )
+    return bisector
+
+
+def test_bisect_next_with_chosen_build(bisector):
+    # the user chose the build to test after a skip
+    bisector.test_runner.verdict = "s"
+    bisector._next_build_index = 2
+
+    bisector._bisect_next()
+
+    # no need to search the mid point, the build range did not change
+    assert not bisector.bisection.search_mid_point.called
+    assert bisector.mid == 2
+    assert bisector._next_build_index is None
+    bisector.bisection.init_handler.assert_called_once_with(2)
+    bisector.download_manager.focus_download.assert_called_once_with(bisector.build_infos)
+
+
+def test_next_builds_downloaded_after_current_build(bisector):
+    next_builds = [Mock(), Mock()]
+    bisector.bisection._find_next_builds.return_value = (5, next_builds)
+    bisector.download_in_background = True
+    bisector.test_runner.verdict = "g"
+    bisector.test_runner.run_error = False
+    bisector.mid = 4
+    bisector.build_infos = Mock(build_file="/path/build")
+
+    bisector._find_next_builds()
+    bisector.index_promise()
+    # next builds are searched, but not downloaded yet
+    bisector.bisection._find_next_builds.assert_called_once_with(
+        4, (), interrupt=bisector.should_stop.is_set
+    )
+    assert not bisector.download_manager.download_in_background.called
+
+    # the current build is downloaded
+    bisector._build_dl_finished(None, "/path/build")
+
+    assert bisector.mid == 5
+    assert bisector.index_promise is None
+    assert bisector.download_manager.download_in_background.call_args_list == [
+        ((build_info,),) for build_info in next_builds
+    ]
+    bisector.bisection.evaluate.assert_called_once_with(bisector.build_infos)
+
+
+def test_build_launched_without_waiting_next_builds(bisector):
+    # the current build is already on disk: its launch must not wait for
+    # the search of the next builds
+    searched, launched = threading.Event(), threading.Event()
+    next_builds = [Mock(), Mock()]
+
+    def find_next_builds(*args, **kwargs):
+        launched.wait(5)
+        searched.set()
+        return 5, next_builds
+
+    def evaluate(build_infos):
+        assert not searched.is_set()
+        assert not bisector.download_manager.download_in_background.called
+        launched.set()
+
+    bisector.bisection._find_next_builds.side_effect = find_next_builds
+    bisector.bisection.evaluate.side_effect = evaluate
+    bisector.download_in_background = True
+    bisector.test_runner.verdict = "g"
+    bisector.test_runner.run_error = False
+    bisector.mid = 4
+    bisector.build_infos = Mock(build_file="/path/build")
+
+    bisector._find_next_builds()
+    bisector._build_dl_finished(None, "/path/build")
+
+    assert launched.is_set()
+    assert searched.is_set()
+    assert bisector.mid == 5
+    assert bisector.download_manager.download_in_background.call_count == 2
+
+
+def test_next_builds_not_downloaded_on_download_error(bisector):
+    bisector.bisection._find_next_builds.return_value = (5, [Mock(), Mock()])
+    bisector.download_in_background = True
+    bisector.test_runner.verdict = "g"
+    bisector.mid = 4
+    bisector.build_infos = Mock(build_file="/path/build")
+
+    bisector._find_next_builds()
+    bisector._build_dl_finished(Mock(is_canceled=lambda: True), "/path/build")
+
+    # the search was waited for, and nothing else happened
+    assert bisector.index_promise is None
+    assert bisector._next_builds == ()
+    assert not bisector.download_manager.download_in_background.called
+    assert not bisector.bisection.evaluate.called
+
+
+def test_next_builds_search_interrupted(bisector):
+    bisector.bisection._find_next_builds.side_effect = StopIteration
+    bisector.download_in_background = True
+    bisector.test_runner.verdict = "g"
+    bisector.test_runner.run_error = False
+    bisector.mid = 4
+    bisector.build_infos = Mock(build_file="/path/build")
+
+    bisector._find_next_builds()
+    bisector._build_dl_finished(None, "/path/build")
+
+    assert bisector.mid == 4
+    assert not bisector.download_manager.download_in_background.called
+
+
+def test_download_finished_is_queued(qtbot):
+    class DownloadManager(QObject):
+        download_finished = Signal(object, str)
+
+    class TestRunner(QObject):
+        evaluate_finished = Signal()
+        verdict = "g"
+        run_error = False
+
+    download_manager = DownloadManager()
+    bisector = GuiBisector(Mock(), TestRunner(), download_manager, download_in_background=False)
+    bisector.bisection = Mock()
+    bisector.build_infos = Mock(build_file="/path/build")
+
+    download_manager.download_finished.emit(None, "/path/build")
+    # the slot is not called directly, but later from the event loop
+    assert not bisector.bisection.evaluate.called
+
+    qtbot.waitUntil(lambda: bisector.bisection.evaluate.called)
+    bisector.bisection.evaluate.assert_called_once_with(bisector.build_infos)
@@ -70,6 +70,20 @@ class TestGuiTestRunner(unittest.TestCase):
         # verdict is defined, launcher is None
         self.assertEqual(self.test_runner.verdict, "g")
 
+    @patch("mozregui.build_runner.create_launcher")
+    def test_app_info_only_read_when_needed(self, create_launcher):
+        launcher = Mock(get_app_info=Mock(return_value={}))
+        create_launcher.return_value = launcher
+
+        build_info = Mock(changeset="abc", repo_url="http://repo")
+        self.test_runner.evaluate(build_info)
+        self.assertEqual(launcher.get_app_info.call_count, 0)
+
+        build_info = Mock(changeset=None, repo_url=None)
+        self.test_runner.evaluate(build_info)
+        self.assertEqual(launcher.get_app_info.call_count, 1)
+        build_info.update_from_app_info.assert_called_once_with({})
+
 
 @pytest.fixture()
 def mock_extract_info():
@@ -77,12 +91,16 @@ def mock_extract_info():
         yield p
 
 
-def test_gui_build_download_manager_focus_download(qtbot, mock_extract_info):
+@pytest.mark.parametrize("progress_interval, progress_count", [(0, 12), (60, 2)])
+def test_gui_build_download_manager_focus_download(
+    qtbot, mock_extract_info, progress_interval, progress_count
+):
     session, session_response = mock_session()
     with tempfile.TemporaryDirectory() as tmpdir:
         tpersist = PersistLimit(10 * 1073741824)
         dl_manager = build_runner.GuiBuildDownloadManager(tmpdir, tpersist)
         dl_manager.session = session
+        dl_manager.progress_interval = progress_interval
         signals = {}
         for sig in ("download_progress", "download_started", "download_finished"):
             signals[sig] = Mock()
@@ -101,7 +119,7 @@ def test_gui_build_download_manager_focus_download(qtbot, mock_extract_info):
         # signals have been emitted
         assert signals["download_started"].call_count == 1
         assert signals["download_finished"].call_count == 1
-        assert signals["download_progress"].call_count == 12
+        assert signals["download_progress"].call_count == progress_count
 
         # well, file has been downloaded finally
         assert os.path.isfile(build_info.build_file)
@@ -154,12 +172,16 @@ def test_runner_started_multiple_times(mock_send_telemetry_ping):
         def __init__(self, *args):
             QObject.__init__(self)
 
+        @Slot()
+        def my_slot(self):
+            pass
+
     class BuildRunner(build_runner.AbstractBuildRunner):
         worker_class = Worker
 
         def init_worker(self, fetch_config, options):
             build_runner.AbstractBuildRunner.init_worker(self, fetch_config, options)
-            return lambda: 1
+            return self.worker.my_slot
 
     fetch_config = create_config("firefox", "linux", 64, "x86_64")
     options = {
@@ -180,3 +202,23 @@ def test_runner_started_multiple_times(mock_send_telemetry_ping):
     assert not runner.stopped
     runner.stop()
     assert runner.stopped
+
+
+def test_runner_action_must_be_a_worker_slot():
+    class Worker(QObject):
+        def __init__(self, *args):
+            QObject.__init__(self)
+
+    class BuildRunner(build_runner.AbstractBuildRunner):
+        worker_class = Worker
+
+        def init_worker(self, fetch_config, options):
+            build_runner.AbstractBuildRunner.init_worker(self, fetch_config, options)
+            return lambda: 1
+
+    runner = BuildRunner(Mock(persist="."))
+    with pytest.raises(AssertionError):
+        runner.start(
+            create_config("firefox", "linux", 64, "x86_64"),
+            {"addons": (), "profile": "/path/to/profile", "profile_persistence": "clone"},
+        )
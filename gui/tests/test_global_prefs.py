@@ -5,6 +5,7 @@ import pytest
 from mock import Mock
 from PySide6.QtWidgets import QDialog
 
+from mozregression import network
 from mozregui import global_prefs
 
 
@@ -63,3 +64,19 @@ def test_change_prefs_dialog_saves_prefs(dlg_result, saved, mocker):
 
     global_prefs.change_prefs_dialog()
     assert dlg.save_prefs.called == saved
+
+
+def test_apply_prefs_reuses_http_session():
+    try:
+        global_prefs.apply_prefs({"http_timeout": 10.0})
+        session = network.get_http_session()
+        # same timeout, the session is kept
+        global_prefs.apply_prefs({"http_timeout": 10.0})
+        assert network.get_http_session() is session
+        # timeout changed, a new session is created
+        global_prefs.apply_prefs({"http_timeout": 20.0})
+        assert network.get_http_session() is not session
+    finally:
+        # remove the global session to not impact other tests
+        network.SESSION = None
+        global_prefs._HTTP_SESSION_TIMEOUT = None
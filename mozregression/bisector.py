@@ -471,36 +471,52 @@ class Bisection(object):
             callback = self._download_next_builds
         return (IndexPromise(mid_point, callback, args=(persist_files,)), build_infos)
 
-    def _download_next_builds(self, mid_point, persist_files=()):
-        # start downloading the next builds.
-        # note that we don't have to worry if builds are already
-        # downloaded, or if our build infos are the same because
-        # this will be handled by the downloadmanager.
-        def start_dl(r):
+    def _find_next_builds(self, mid_point, persist_files=(), interrupt=None):
+        """
+        Find the build infos of the next builds to test, depending on the
+        verdict that will be given for the build at mid_point.
+
+        Returns a tuple (mid_point, build_infos), where mid_point is the
+        updated index of the current build and build_infos the list of
+        builds that need to be downloaded.
+        """
+        build_infos = []
+
+        def find(r):
             # first get the next mid point
             # this will trigger some blocking downloads
             # (we need to find the build info)
-            m = r.mid_point()
+            m = r.mid_point(interrupt=interrupt)
             if len(r) != 0:
-                # non-blocking download of the build
                 if (
                     self.approx_chooser
                     and self.approx_chooser.index(r, r[m], persist_files) is not None
                 ):
                     pass  # nothing to download, we have an approx build
                 else:
-                    self.download_manager.download_in_background(r[m])
+                    build_infos.append(r[m])
 
         bdata = self.build_range[mid_point]
-        # download next left mid point
-        start_dl(self.build_range[mid_point:])
-        # download right next mid point
-        start_dl(self.build_range[: mid_point + 1])
+        # next left mid point
+        find(self.build_range[mid_point:])
+        # right next mid point
+        find(self.build_range[: mid_point + 1])
         # since we called mid_point() on copy of self.build_range instance,
         # the underlying cache may have changed and we need to find the new
         # mid point.
         self.build_range.filter_invalid_builds()
-        return self.build_range.index(bdata)
+        return self.build_range.index(bdata), build_infos
+
+    def _download_next_builds(self, mid_point, persist_files=()):
+        # start downloading the next builds.
+        # note that we don't have to worry if builds are already
+        # downloaded, or if our build infos are the same because
+        # this will be handled by the downloadmanager.
+        mid_point, build_infos = self._find_next_builds(mid_point, persist_files)
+        for build_info in build_infos:
+            # non-blocking download of the build
+            self.download_manager.download_in_background(build_info)
+        return mid_point
 
     def evaluate(self, build_infos):
         verdict = self.test_runner.evaluate(build_infos, allow_back=bool(self.history))
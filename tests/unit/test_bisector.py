@@ -462,5 +462,31 @@ class TestBisector(unittest.TestCase):
         _bisect.assert_called_with(self.handler, build_range)
 
 
+class TestBisection(unittest.TestCase):
+    def setUp(self):
+        self.download_manager = Mock()
+        self.build_range = MyBuildData([1, 2, 3, 4, 5])
+        self.bisection = Bisection(Mock(), self.build_range, self.download_manager, Mock())
+
+    def test_find_next_builds(self):
+        mid, build_infos = self.bisection._find_next_builds(2)
+        self.assertEqual(mid, 2)
+        # next mid points if the build is good, or bad
+        self.assertEqual([b.data for b in build_infos], [4, 2])
+        # nothing is downloaded
+        self.assertFalse(self.download_manager.download_in_background.called)
+
+    def test_find_next_builds_interrupted(self):
+        with self.assertRaises(StopIteration):
+            self.bisection._find_next_builds(2, interrupt=lambda: True)
+
+    def test_download_next_builds(self):
+        mid = self.bisection._download_next_builds(2)
+        self.assertEqual(mid, 2)
+        self.download_manager.download_in_background.assert_has_calls(
+            [call(self.build_range[3]), call(self.build_range[1])]
+        )
+
+
 if __name__ == "__main__":
     unittest.main()